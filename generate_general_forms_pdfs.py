@@ -6,78 +6,192 @@ All content is fictional and for testing purposes only
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-import os
+import io
 from datetime import datetime, timedelta
+from pathlib import Path
+
+from pdf_helpers import label_value_table, preload_fonts, render_documents
+
+preload_fonts("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Courier")
+
+# Palette, bound once so the drawing code avoids repeated colors.* lookups
+_BLACK = colors.black
+_WHITE = colors.white
+_GREY = colors.grey
+_DARKGREY = colors.darkgrey
+_WHITESMOKE = colors.whitesmoke
+_RED = colors.red
+_LIGHTBLUE = colors.lightblue
+_LIGHTCYAN = colors.lightcyan
+
+# Redacted machine readable zone lines for the passport page
+_MRZ_LINE1 = "P<USA" + "X" * 25
+_MRZ_LINE2 = "X" * 30
+
+# Template options: compressed page streams and no embedded timestamps
+_DOC_OPTIONS = dict(pagesize=letter, invariant=1, pageCompression=1)
+
+class _FrozenStyleSheet(StyleSheet1):
+    """Style sheet that refuses new styles once frozen, so it can be shared safely"""
+
+    _frozen = False
+
+    def add(self, style, alias=None):
+        if self._frozen:
+            raise TypeError(f"Cannot add style '{style.name}' to a frozen style sheet")
+        super().add(style, alias)
+
+def _build_style_sheet():
+    """Collect every style the documents use into one frozen sheet"""
+    sample = getSampleStyleSheet()
+    sheet = _FrozenStyleSheet()
+    for name in ('Normal', 'Title', 'Heading1', 'Heading2'):
+        sheet.add(sample[name])
+    sheet.add(ParagraphStyle('Footer', fontSize=8, textColor=_GREY))
+    sheet.add(ParagraphStyle('Disclaimer', fontSize=8, textColor=_GREY))
+    sheet.add(ParagraphStyle('Notice', fontSize=9, textColor=_RED))
+    sheet._frozen = True
+    return sheet
+
+_STYLES = _build_style_sheet()
+
+# Fixed boilerplate paragraphs, parsed once. wrap() redoes a Paragraph's line
+# breaking on every build, so each document can append the same instance
+_FOOTER_FLOWABLE = Paragraph("This is a sample document for testing purposes only. All information is fictional.", _STYLES['Footer'])
+_DISCLAIMER_FLOWABLE_EMPLOYMENT = Paragraph("<i>This letter is confidential and intended solely for the purpose stated. Any unauthorized distribution or use is prohibited.</i>", _STYLES['Disclaimer'])
+_DISCLAIMER_FLOWABLE_MEDICAL = Paragraph("<i>This medical certificate is confidential and contains protected health information. Distribution is restricted to authorized parties only.</i>", _STYLES['Disclaimer'])
+_PRIVACY_NOTICE_FLOWABLE = Paragraph("<b>PRIVACY NOTICE:</b> Specific transaction details and amounts have been redacted for privacy protection. This statement demonstrates format and layout only.", _STYLES['Notice'])
+
+# ID card and passport page sizes in whole points, so every coordinate the
+# builders derive from them stays integer arithmetic
+_ID_CARD_SIZE = (int(3.375*inch), int(2.125*inch))
+_PASSPORT_SIZE = (int(4.25*inch), int(5.5*inch))
+
+# Metered lines on the utility bill:
+# (service, usage key, usage unit, rate key, rate unit, charge key)
+_METERED_SERVICES = (
+    ('Electricity', 'kwh_usage', 'kWh', 'kwh_rate', 'kWh', 'electric_charge'),
+    ('Natural Gas', 'gas_usage', 'Therms', 'gas_rate', 'Therm', 'gas_charge'),
+    ('Water/Sewer', 'water_usage', 'Gallons', 'water_rate', 'Gal', 'water_charge'),
+)
+
+_CHARGES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _GREY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _WHITESMOKE),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -2), 1, _BLACK),
+    ('LINEABOVE', (0, -1), (-1, -1), 2, _BLACK)
+])
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, _BLACK)
+])
+
+_TRANSACTION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _GREY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _WHITESMOKE),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('GRID', (0, 0), (-1, -1), 1, _BLACK)
+])
+
+def _letterhead(name, *lines, space_after=20):
+    """Organisation name in the title style followed by its address and contact lines"""
+    flowables = [Paragraph(name, _STYLES['Title'])]
+    flowables += [Paragraph(line, _STYLES['Normal']) for line in lines]
+    flowables.append(Spacer(1, space_after))
+    return flowables
 
 def create_id_card(filename, id_data):
     """Create a sample ID card (redacted for privacy)"""
-    c = canvas.Canvas(filename, pagesize=(3.375*inch, 2.125*inch))
-    width, height = 3.375*inch, 2.125*inch
+    buf = io.BytesIO()
+    width, height = _ID_CARD_SIZE
+    c = canvas.Canvas(buf, pagesize=(width, height), pageCompression=1, invariant=1)
     
     # Front side
-    c.setFillColor(colors.lightblue)
+    c.setFillColor(_LIGHTBLUE)
     c.rect(0, 0, width, height, fill=1)
     
-    c.setFillColor(colors.black)
-    c.setFont("Helvetica-Bold", 8)
-    c.drawString(5, height - 15, "IDENTIFICATION CARD")
+    c.setFillColor(_BLACK)
+    text = c.beginText(5, height - 15)
+    text.setFont("Helvetica-Bold", 8)
+    text.textLine("IDENTIFICATION CARD")
     
-    c.setFont("Helvetica", 6)
-    c.drawString(5, height - 30, f"ID Number: {id_data['id_number']}")
-    c.drawString(5, height - 42, f"Issued: {id_data['issue_date']}")
-    c.drawString(5, height - 54, f"Expires: {id_data['expiry_date']}")
+    text.setTextOrigin(5, height - 30)
+    text.setFont("Helvetica", 6, 12)
+    text.textLine(f"ID Number: {id_data['id_number']}")
+    text.textLine(f"Issued: {id_data['issue_date']}")
+    text.textLine(f"Expires: {id_data['expiry_date']}")
     
     # Personal info (redacted)
-    c.drawString(5, height - 75, f"Name: {id_data['name_redacted']}")
-    c.drawString(5, height - 87, f"DOB: {id_data['dob_redacted']}")
-    c.drawString(5, height - 99, f"Address: {id_data['address_redacted']}")
+    text.setTextOrigin(5, height - 75)
+    text.textLine(f"Name: {id_data['name_redacted']}")
+    text.textLine(f"DOB: {id_data['dob_redacted']}")
+    text.textLine(f"Address: {id_data['address_redacted']}")
+    c.drawText(text)
     
     # Photo placeholder
-    c.setFillColor(colors.grey)
+    c.setFillColor(_GREY)
     c.rect(width - 60, height - 90, 55, 70, fill=1)
-    c.setFillColor(colors.white)
+    c.setFillColor(_WHITE)
     c.setFont("Helvetica", 5)
     c.drawString(width - 55, height - 55, "PHOTO")
     c.drawString(width - 58, height - 48, "REDACTED")
     
     # Redaction notice
-    c.setFillColor(colors.red)
+    c.setFillColor(_RED)
     c.setFont("Helvetica-Bold", 5)
     c.drawString(5, 10, "SAMPLE DOCUMENT - PERSONAL INFO REDACTED FOR PRIVACY")
     
     c.save()
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_passport_sample(filename, passport_data):
     """Create a sample passport page (redacted for privacy)"""
-    c = canvas.Canvas(filename, pagesize=(4.25*inch, 5.5*inch))
-    width, height = 4.25*inch, 5.5*inch
+    buf = io.BytesIO()
+    width, height = _PASSPORT_SIZE
+    c = canvas.Canvas(buf, pagesize=(width, height), pageCompression=1, invariant=1)
     
     # Background
-    c.setFillColor(colors.lightcyan)
+    c.setFillColor(_LIGHTCYAN)
     c.rect(0, 0, width, height, fill=1)
     
-    c.setFillColor(colors.black)
-    c.setFont("Helvetica-Bold", 10)
-    c.drawString(10, height - 25, "UNITED STATES OF AMERICA")
-    c.setFont("Helvetica-Bold", 8)
-    c.drawString(10, height - 40, "PASSPORT")
+    c.setFillColor(_BLACK)
+    text = c.beginText(10, height - 25)
+    text.setFont("Helvetica-Bold", 10)
+    text.textLine("UNITED STATES OF AMERICA")
+    text.setTextOrigin(10, height - 40)
+    text.setFont("Helvetica-Bold", 8)
+    text.textLine("PASSPORT")
     
     # Document info
-    c.setFont("Helvetica", 6)
-    c.drawString(10, height - 60, f"Passport No: {passport_data['passport_number']}")
-    c.drawString(10, height - 72, f"Type: {passport_data['passport_type']}")
-    c.drawString(10, height - 84, f"Issued: {passport_data['issue_date']}")
-    c.drawString(10, height - 96, f"Expires: {passport_data['expiry_date']}")
-    
-    # Personal data (redacted)
-    c.setFont("Helvetica-Bold", 7)
-    c.drawString(10, height - 120, "PERSONAL DATA (REDACTED)")
-    
-    c.setFont("Helvetica", 6)
+    text.setTextOrigin(10, height - 60)
+    text.setFont("Helvetica", 6, 12)
+    text.textLine(f"Passport No: {passport_data['passport_number']}")
+    text.textLine(f"Type: {passport_data['passport_type']}")
+    text.textLine(f"Issued: {passport_data['issue_date']}")
+    text.textLine(f"Expires: {passport_data['expiry_date']}")
+    
+    # Personal data (redacted), written straight after the document info so
+    # both 6pt runs share one font change; its heading follows below
+    text.setTextOrigin(10, height - 140)
     personal_data = [
         f"Surname: {passport_data['surname_redacted']}",
         f"Given Names: {passport_data['given_names_redacted']}",
@@ -87,47 +201,52 @@ def create_passport_sample(filename, passport_data):
         f"Sex: {passport_data['sex_redacted']}"
     ]
     
-    y_pos = height - 140
     for data in personal_data:
-        c.drawString(10, y_pos, data)
-        y_pos -= 12
+        text.textLine(data)
+    
+    text.setTextOrigin(10, height - 120)
+    text.setFont("Helvetica-Bold", 7)
+    text.textLine("PERSONAL DATA (REDACTED)")
+    c.drawText(text)
     
     # Photo area
-    c.setFillColor(colors.grey)
+    c.setFillColor(_GREY)
     c.rect(width - 80, height - 180, 70, 90, fill=1)
-    c.setFillColor(colors.white)
+    c.setFillColor(_WHITE)
     c.setFont("Helvetica", 5)
     c.drawString(width - 75, height - 135, "PHOTO")
     c.drawString(width - 78, height - 128, "REDACTED")
     
     # Machine readable zone (redacted)
-    c.setFillColor(colors.darkgrey)
+    c.setFillColor(_DARKGREY)
     c.rect(10, 20, width - 20, 30, fill=1)
-    c.setFillColor(colors.white)
+    c.setFillColor(_WHITE)
     c.setFont("Courier", 5)
-    c.drawString(15, 40, "P<USA" + "X" * 25)
-    c.drawString(15, 32, "X" * 30)
+    c.drawString(15, 40, _MRZ_LINE1)
+    c.drawString(15, 32, _MRZ_LINE2)
     c.drawString(15, 24, "MACHINE READABLE ZONE REDACTED")
     
     # Redaction notice
-    c.setFillColor(colors.red)
+    c.setFillColor(_RED)
     c.setFont("Helvetica-Bold", 5)
     c.drawString(10, 5, "SAMPLE DOCUMENT - PERSONAL INFO REDACTED FOR PRIVACY")
     
     c.save()
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_proof_of_address(filename, address_data):
     """Create a proof of address document (utility bill style)"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, **_DOC_OPTIONS)
+    styles = _STYLES
     story = []
     
     # Company header
-    title = Paragraph("CITY UTILITIES COMPANY", styles['Title'])
-    story.append(title)
-    story.append(Paragraph("123 Utility Street, Springfield, IL 62701", styles['Normal']))
-    story.append(Paragraph("Phone: (555) 123-UTIL | www.cityutilities.com", styles['Normal']))
-    story.append(Spacer(1, 20))
+    story.extend(_letterhead(
+        "CITY UTILITIES COMPANY",
+        "123 Utility Street, Springfield, IL 62701",
+        "Phone: (555) 123-UTIL | www.cityutilities.com"
+    ))
     
     # Account info
     account_info = [
@@ -138,14 +257,7 @@ def create_proof_of_address(filename, address_data):
         ['Due Date:', address_data['due_date']]
     ]
     
-    info_table = Table(account_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    story.append(info_table)
+    story.append(label_value_table(account_info, 11, 8))
     story.append(Spacer(1, 20))
     
     # Customer info
@@ -159,42 +271,27 @@ def create_proof_of_address(filename, address_data):
         ['Service Type:', address_data['service_type']]
     ]
     
-    customer_table = Table(customer_info, colWidths=[2*inch, 4*inch])
-    customer_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    story.append(customer_table)
+    story.append(label_value_table(customer_info))
     story.append(Spacer(1, 20))
     
     # Usage and charges
     charges_title = Paragraph("CURRENT CHARGES", styles['Heading2'])
     story.append(charges_title)
     
-    charges_data = [
-        ['Service', 'Usage', 'Rate', 'Amount'],
-        ['Electricity', f"{address_data['kwh_usage']} kWh", f"${address_data['kwh_rate']:.4f}/kWh", f"${address_data['electric_charge']:.2f}"],
-        ['Natural Gas', f"{address_data['gas_usage']} Therms", f"${address_data['gas_rate']:.4f}/Therm", f"${address_data['gas_charge']:.2f}"],
-        ['Water/Sewer', f"{address_data['water_usage']} Gallons", f"${address_data['water_rate']:.4f}/Gal", f"${address_data['water_charge']:.2f}"],
-        ['Service Fee', '1', f"${address_data['service_fee']:.2f}", f"${address_data['service_fee']:.2f}"],
+    charges_data = [['Service', 'Usage', 'Rate', 'Amount']]
+    charges_data += [
+        [service, f"{address_data[usage_key]} {usage_unit}", f"${address_data[rate_key]:.4f}/{rate_unit}", f"${address_data[charge_key]:.2f}"]
+        for service, usage_key, usage_unit, rate_key, rate_unit, charge_key in _METERED_SERVICES
+    ]
+    service_fee = f"${address_data['service_fee']:.2f}"
+    charges_data += [
+        ['Service Fee', '1', service_fee, service_fee],
         ['Taxes', '', '', f"${address_data['taxes']:.2f}"],
         ['Total Amount Due', '', '', f"${address_data['total_due']:.2f}"]
     ]
     
     charges_table = Table(charges_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch])
-    charges_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -2), 1, colors.black),
-        ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black)
-    ]))
+    charges_table.setStyle(_CHARGES_TABLE_STYLE)
     story.append(charges_table)
     story.append(Spacer(1, 20))
     
@@ -218,25 +315,25 @@ def create_proof_of_address(filename, address_data):
     story.append(payment_para)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
     story.append(Spacer(1, 30))
-    story.append(footer)
+    story.append(_FOOTER_FLOWABLE)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_bank_statement(filename, bank_data):
     """Create a sample bank statement (redacted)"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, **_DOC_OPTIONS)
+    styles = _STYLES
     story = []
     
     # Bank header
-    title = Paragraph("FIRST NATIONAL BANK", styles['Title'])
-    story.append(title)
-    story.append(Paragraph("456 Banking Street, Chicago, IL 60601", styles['Normal']))
-    story.append(Paragraph("Phone: (312) 555-BANK | www.firstnationalbank.com", styles['Normal']))
-    story.append(Spacer(1, 20))
+    story.extend(_letterhead(
+        "FIRST NATIONAL BANK",
+        "456 Banking Street, Chicago, IL 60601",
+        "Phone: (312) 555-BANK | www.firstnationalbank.com"
+    ))
     
     # Statement header
     statement_title = Paragraph("MONTHLY ACCOUNT STATEMENT", styles['Heading1'])
@@ -252,39 +349,27 @@ def create_bank_statement(filename, bank_data):
         ['Statement Date:', bank_data['statement_date']]
     ]
     
-    info_table = Table(account_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    story.append(info_table)
+    story.append(label_value_table(account_info, 11, 8))
     story.append(Spacer(1, 20))
     
     # Account summary
     summary_title = Paragraph("ACCOUNT SUMMARY", styles['Heading2'])
     story.append(summary_title)
     
+    # Both balances also open and close the transaction history below
+    beginning_balance = f"${bank_data['beginning_balance']:.2f}"
+    ending_balance = f"${bank_data['ending_balance']:.2f}"
     summary_info = [
-        ['Beginning Balance:', f"${bank_data['beginning_balance']:.2f}"],
+        ['Beginning Balance:', beginning_balance],
         ['Total Deposits:', f"${bank_data['total_deposits']:.2f}"],
         ['Total Withdrawals:', f"${bank_data['total_withdrawals']:.2f}"],
         ['Service Charges:', f"${bank_data['service_charges']:.2f}"],
         ['Interest Earned:', f"${bank_data['interest_earned']:.2f}"],
-        ['Ending Balance:', f"${bank_data['ending_balance']:.2f}"]
+        ['Ending Balance:', ending_balance]
     ]
     
     summary_table = Table(summary_info, colWidths=[2*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black)
-    ]))
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
     story.append(summary_table)
     story.append(Spacer(1, 20))
     
@@ -294,55 +379,45 @@ def create_bank_statement(filename, bank_data):
     
     transaction_data = [
         ['Date', 'Description', 'Withdrawal', 'Deposit', 'Balance'],
-        [bank_data['statement_start'], 'Beginning Balance', '', '', f"${bank_data['beginning_balance']:.2f}"],
+        [bank_data['statement_start'], 'Beginning Balance', '', '', beginning_balance],
         ['XX/XX/XXXX', 'DEPOSIT - PAYROLL [REDACTED]', '', 'XXX.XX', 'XXX.XX'],
         ['XX/XX/XXXX', 'DEBIT CARD PURCHASE [REDACTED]', 'XXX.XX', '', 'XXX.XX'],
         ['XX/XX/XXXX', 'ONLINE TRANSFER [REDACTED]', 'XXX.XX', '', 'XXX.XX'],
         ['XX/XX/XXXX', 'ATM WITHDRAWAL [REDACTED]', 'XXX.XX', '', 'XXX.XX'],
         ['XX/XX/XXXX', 'DEPOSIT - MOBILE [REDACTED]', '', 'XXX.XX', 'XXX.XX'],
-        [bank_data['statement_end'], 'Ending Balance', '', '', f"${bank_data['ending_balance']:.2f}"]
+        [bank_data['statement_end'], 'Ending Balance', '', '', ending_balance]
     ]
     
     transaction_table = Table(transaction_data, colWidths=[1*inch, 2.5*inch, 1*inch, 1*inch, 1*inch])
-    transaction_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    transaction_table.setStyle(_TRANSACTION_TABLE_STYLE)
     story.append(transaction_table)
     story.append(Spacer(1, 20))
     
     # Redaction notice
-    redaction_notice = Paragraph("<b>PRIVACY NOTICE:</b> Specific transaction details and amounts have been redacted for privacy protection. This statement demonstrates format and layout only.", 
-                                ParagraphStyle('Notice', fontSize=9, textColor=colors.red))
-    story.append(redaction_notice)
+    story.append(_PRIVACY_NOTICE_FLOWABLE)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
     story.append(Spacer(1, 30))
-    story.append(footer)
+    story.append(_FOOTER_FLOWABLE)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_employment_letter(filename, employment_data):
     """Create an employment verification letter"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, **_DOC_OPTIONS)
+    styles = _STYLES
     story = []
     
     # Company letterhead
-    company_title = Paragraph("GLOBAL TECHNOLOGY SOLUTIONS INC.", styles['Title'])
-    story.append(company_title)
-    story.append(Paragraph("789 Business Park Drive, Suite 500", styles['Normal']))
-    story.append(Paragraph("Chicago, Illinois 60601", styles['Normal']))
-    story.append(Paragraph("Phone: (312) 555-0199 | Fax: (312) 555-0198", styles['Normal']))
-    story.append(Spacer(1, 30))
+    story.extend(_letterhead(
+        "GLOBAL TECHNOLOGY SOLUTIONS INC.",
+        "789 Business Park Drive, Suite 500",
+        "Chicago, Illinois 60601",
+        "Phone: (312) 555-0199 | Fax: (312) 555-0198",
+        space_after=30
+    ))
     
     # Date
     date_para = Paragraph(f"Date: {employment_data['letter_date']}", styles['Normal'])
@@ -414,30 +489,28 @@ def create_employment_letter(filename, employment_data):
     story.append(Spacer(1, 20))
     
     # Disclaimer
-    disclaimer = Paragraph("<i>This letter is confidential and intended solely for the purpose stated. Any unauthorized distribution or use is prohibited.</i>", 
-                          ParagraphStyle('Disclaimer', fontSize=8, textColor=colors.grey))
-    story.append(disclaimer)
+    story.append(_DISCLAIMER_FLOWABLE_EMPLOYMENT)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
     story.append(Spacer(1, 20))
-    story.append(footer)
+    story.append(_FOOTER_FLOWABLE)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_medical_certificate(filename, medical_data):
     """Create a medical certificate for general accident insurance"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, **_DOC_OPTIONS)
+    styles = _STYLES
     story = []
     
     # Medical practice header
-    practice_title = Paragraph("SPRINGFIELD MEDICAL CENTER", styles['Title'])
-    story.append(practice_title)
-    story.append(Paragraph("123 Healthcare Drive, Springfield, IL 62701", styles['Normal']))
-    story.append(Paragraph("Phone: (217) 555-CARE | Fax: (217) 555-CARE", styles['Normal']))
-    story.append(Spacer(1, 20))
+    story.extend(_letterhead(
+        "SPRINGFIELD MEDICAL CENTER",
+        "123 Healthcare Drive, Springfield, IL 62701",
+        "Phone: (217) 555-CARE | Fax: (217) 555-CARE"
+    ))
     
     # Certificate title
     cert_title = Paragraph("MEDICAL CERTIFICATE", styles['Heading1'])
@@ -453,14 +526,7 @@ def create_medical_certificate(filename, medical_data):
         ['Specialty:', medical_data['physician_specialty']]
     ]
     
-    info_table = Table(cert_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    story.append(info_table)
+    story.append(label_value_table(cert_info, 11, 8))
     story.append(Spacer(1, 20))
     
     # Patient information
@@ -474,14 +540,7 @@ def create_medical_certificate(filename, medical_data):
         ['Examination Date:', medical_data['examination_date']]
     ]
     
-    patient_table = Table(patient_info, colWidths=[2*inch, 4*inch])
-    patient_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    story.append(patient_table)
+    story.append(label_value_table(patient_info))
     story.append(Spacer(1, 20))
     
     # Medical findings
@@ -543,22 +602,18 @@ def create_medical_certificate(filename, medical_data):
     story.append(Spacer(1, 20))
     
     # Disclaimer
-    disclaimer = Paragraph("<i>This medical certificate is confidential and contains protected health information. Distribution is restricted to authorized parties only.</i>", 
-                          ParagraphStyle('Disclaimer', fontSize=8, textColor=colors.grey))
-    story.append(disclaimer)
+    story.append(_DISCLAIMER_FLOWABLE_MEDICAL)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
     story.append(Spacer(1, 20))
-    story.append(footer)
+    story.append(_FOOTER_FLOWABLE)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
-def generate_general_forms_docs():
-    """Generate all general forms documents"""
-    # Sample data
-    id_data = {
+def _id_data():
+    """Sample data for the redacted ID card"""
+    return {
         'id_number': 'ID-789456123',
         'issue_date': '2022-01-15',
         'expiry_date': '2027-01-15',
@@ -566,8 +621,10 @@ def generate_general_forms_docs():
         'dob_redacted': 'XX/XX/XXXX',
         'address_redacted': 'XXX XXXXXXX ST, XXXXXXX, XX XXXXX'
     }
-    
-    passport_data = {
+
+def _passport_data():
+    """Sample data for the redacted passport page"""
+    return {
         'passport_number': 'XXXXXXXXX',
         'passport_type': 'P',
         'issue_date': '15 JAN 22',
@@ -579,8 +636,10 @@ def generate_general_forms_docs():
         'pob_redacted': 'XXXXXXX, XX, USA',
         'sex_redacted': 'X'
     }
-    
-    address_data = {
+
+def _address_data():
+    """Sample data for the utility bill used as proof of address"""
+    return {
         'account_number': 'UTIL-789456',
         'service_address': '123 Main Street, Springfield, IL 62701',
         'billing_start': '2024-08-01',
@@ -604,8 +663,10 @@ def generate_general_forms_docs():
         'taxes': 27.18,
         'total_due': 296.77
     }
-    
-    bank_data = {
+
+def _bank_data():
+    """Sample data for the bank statement"""
+    return {
         'account_holder': 'John M. Smith',
         'account_number_redacted': 'XXXX-XXXX-XXXX-5678',
         'account_type': 'Personal Checking',
@@ -619,8 +680,10 @@ def generate_general_forms_docs():
         'interest_earned': 2.15,
         'ending_balance': 4889.00
     }
-    
-    employment_data = {
+
+def _employment_data():
+    """Sample data for the employment verification letter"""
+    return {
         'letter_date': '2024-09-15',
         'employee_name': 'Jennifer Martinez',
         'employee_id': 'EMP-5678',
@@ -636,8 +699,10 @@ def generate_general_forms_docs():
         'work_location': 'Chicago, IL Office with Remote Work Options',
         'performance_note': 'excellent technical skills and professional conduct'
     }
-    
-    medical_data = {
+
+def _medical_data():
+    """Sample data for the medical certificate"""
+    return {
         'certificate_number': 'MED-CERT-789456',
         'issue_date': '2024-09-18',
         'physician_name': 'Dr. Emily Rodriguez',
@@ -664,14 +729,20 @@ def generate_general_forms_docs():
         'signature_date': '2024-09-18',
         'physician_credentials': 'MD, FAAFP'
     }
-    
-    # Generate documents
-    create_id_card('test-documents/general-forms/sample_id_card_redacted.pdf', id_data)
-    create_passport_sample('test-documents/general-forms/sample_passport_redacted.pdf', passport_data)
-    create_proof_of_address('test-documents/general-forms/proof_of_address_utility_bill.pdf', address_data)
-    create_bank_statement('test-documents/general-forms/bank_statement_sample.pdf', bank_data)
-    create_employment_letter('test-documents/general-forms/employment_verification_letter.pdf', employment_data)
-    create_medical_certificate('test-documents/general-forms/medical_certificate.pdf', medical_data)
+
+# General forms by name, as (output file, builder, sample data factory)
+_GENERATORS = {
+    'id_card': ('sample_id_card_redacted.pdf', create_id_card, _id_data),
+    'passport': ('sample_passport_redacted.pdf', create_passport_sample, _passport_data),
+    'proof_of_address': ('proof_of_address_utility_bill.pdf', create_proof_of_address, _address_data),
+    'bank_statement': ('bank_statement_sample.pdf', create_bank_statement, _bank_data),
+    'employment_letter': ('employment_verification_letter.pdf', create_employment_letter, _employment_data),
+    'medical_certificate': ('medical_certificate.pdf', create_medical_certificate, _medical_data)
+}
+
+def generate_general_forms_docs(*which):
+    """Generate all general forms documents, or only the ones named"""
+    render_documents('test-documents/general-forms', _GENERATORS, which, max_workers=6)
 
 if __name__ == "__main__":
     generate_general_forms_docs()
@@ -10,12 +10,126 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+import io
 import os
 from datetime import datetime, timedelta
+from pathlib import Path
+
+from pdf_helpers import GREY_HEADER_STYLE, TOTAL_ROW_TABLE_STYLE, draw_detail_rows, label_value_table, preload_fonts, render_documents
+
+preload_fonts("Helvetica", "Helvetica-Bold", "Helvetica-BoldOblique")
+
+# Sample sheet entries the builders use
+_STYLES = getSampleStyleSheet()
+_TITLE = _STYLES['Title']
+_H2 = _STYLES['Heading2']
+_H3 = _STYLES['Heading3']
+_NORMAL = _STYLES['Normal']
+_FOOTER_STYLE = ParagraphStyle('Footer', fontSize=8, textColor=colors.grey)
+
+# Closing spacer and sample-document notice appended to every story
+_FOOTER_FLOWABLES = [
+    Spacer(1, 30),
+    Paragraph("This is a sample document for testing purposes only. All information is fictional.", _FOOTER_STYLE)
+]
+
+# The policy's exclusions summary has no per-policy fields, so parse it once
+_EXCLUSIONS_PARA = Paragraph("""
+    This policy does not cover claims arising from:
+    
+    • Professional services (requires separate Professional Liability coverage)
+    • Cyber/data breach incidents (requires separate Cyber Liability coverage)
+    • Employment practices (requires separate Employment Practices Liability coverage)
+    • Pollution incidents (requires separate Environmental coverage)
+    • Aircraft, auto, or watercraft operations (require separate coverage)
+    • Workers' compensation (requires separate coverage)
+    • Intentional criminal acts
+    
+    This is a summary only. Please refer to the complete policy for all terms and conditions.
+    """, _NORMAL)
+
+# Balance sheet and income statement tables; each adds its own bold section rows
+_MONEY_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
+    ('LINEBELOW', (0, -1), (-1, -1), 2, colors.black)
+])
+
+_ASSETS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 7), (0, 7), 'Helvetica-Bold')
+], parent=_MONEY_TABLE_STYLE)
+
+_LIABILITIES_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 7), (0, 7), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 9), (0, 9), 'Helvetica-Bold')
+], parent=_MONEY_TABLE_STYLE)
+
+_INCOME_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 4), (0, 4), 'Helvetica-Bold')
+], parent=_MONEY_TABLE_STYLE)
+
+# Payment and category grids derive from the shared grey header row
+_PAYMENT_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+], parent=GREY_HEADER_STYLE)
+
+_CATEGORIES_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+], parent=GREY_HEADER_STYLE)
+
+_SIGNATURE_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Dollar amounts each document prints; every other field is shown as given
+_FINANCIAL_MONEY_FIELDS = (
+    'cash', 'accounts_receivable', 'inventory', 'prepaid_expenses',
+    'total_current_assets', 'ppe', 'accumulated_depreciation',
+    'net_fixed_assets', 'total_assets', 'accounts_payable', 'accrued_expenses',
+    'short_term_debt', 'total_current_liabilities', 'long_term_debt',
+    'total_liabilities', 'common_stock', 'retained_earnings', 'total_equity',
+    'total_liab_equity', 'revenue', 'cogs', 'gross_profit', 'salaries',
+    'rent_utilities', 'marketing', 'professional_services', 'other_expenses',
+    'total_operating_expenses', 'operating_income', 'interest_expense',
+    'income_before_taxes', 'tax_expense', 'net_income'
+)
+
+_POLICY_MONEY_FIELDS = (
+    'each_occurrence', 'general_aggregate', 'bd_pd_premium',
+    'personal_injury_limit', 'personal_injury_premium',
+    'products_ops_occurrence', 'products_ops_aggregate', 'products_ops_premium',
+    'medical_expenses', 'medical_premium', 'total_premium', 'deductible'
+)
+
+_CONTRACT_MONEY_FIELDS = (
+    'contract_value', 'initial_payment', 'progress_payment_1',
+    'progress_payment_2', 'final_payment', 'total_payments',
+    'required_gl_coverage', 'required_pl_coverage', 'required_auto_coverage'
+)
+
+def _money_fields(data, fields):
+    """Format the named fields of a document's data as whole dollars in one pass"""
+    return {key: f"${data[key]:,}" for key in fields}
 
 def create_business_registration(filename, business_data):
     """Create a business registration certificate"""
-    c = canvas.Canvas(filename, pagesize=letter)
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
     width, height = letter
     
     # Header
@@ -25,10 +139,12 @@ def create_business_registration(filename, business_data):
     c.drawString(50, height - 80, "CERTIFICATE OF BUSINESS REGISTRATION")
     
     # Registration number and dates
-    c.setFont("Helvetica", 10)
-    c.drawString(width - 250, height - 50, f"Registration No: {business_data['registration_number']}")
-    c.drawString(width - 250, height - 70, f"Issue Date: {business_data['issue_date']}")
-    c.drawString(width - 250, height - 90, f"Expiration: {business_data['expiration_date']}")
+    reg_info = c.beginText(width - 250, height - 50)
+    reg_info.setFont("Helvetica", 10, 20)
+    reg_info.textLine(f"Registration No: {business_data['registration_number']}")
+    reg_info.textLine(f"Issue Date: {business_data['issue_date']}")
+    reg_info.textLine(f"Expiration: {business_data['expiration_date']}")
+    c.drawText(reg_info)
     
     # Business information
     y_pos = height - 140
@@ -36,7 +152,6 @@ def create_business_registration(filename, business_data):
     c.drawString(50, y_pos, "BUSINESS INFORMATION")
     
     y_pos -= 30
-    c.setFont("Helvetica", 11)
     business_details = [
         ("Business Name:", business_data['business_name']),
         ("DBA Name:", business_data['dba_name']),
@@ -45,11 +160,7 @@ def create_business_registration(filename, business_data):
         ("Federal EIN:", business_data['federal_ein']),
         ("State Tax ID:", business_data['state_tax_id'])
     ]
-    
-    for label, value in business_details:
-        c.drawString(50, y_pos, label)
-        c.drawString(200, y_pos, value)
-        y_pos -= 25
+    y_pos = draw_detail_rows(c, y_pos, business_details)
     
     # Business address
     y_pos -= 20
@@ -57,18 +168,13 @@ def create_business_registration(filename, business_data):
     c.drawString(50, y_pos, "BUSINESS ADDRESS")
     
     y_pos -= 30
-    c.setFont("Helvetica", 11)
     address_details = [
         ("Street Address:", business_data['street_address']),
         ("City, State, ZIP:", f"{business_data['city']}, {business_data['state']} {business_data['zip_code']}"),
         ("Phone:", business_data['phone']),
         ("Email:", business_data['email'])
     ]
-    
-    for label, value in address_details:
-        c.drawString(50, y_pos, label)
-        c.drawString(200, y_pos, value)
-        y_pos -= 25
+    y_pos = draw_detail_rows(c, y_pos, address_details)
     
     # Owner/Officer information
     y_pos -= 20
@@ -76,18 +182,13 @@ def create_business_registration(filename, business_data):
     c.drawString(50, y_pos, "OWNER/OFFICER INFORMATION")
     
     y_pos -= 30
-    c.setFont("Helvetica", 11)
     owner_details = [
         ("Principal Owner:", business_data['principal_owner']),
         ("Title:", business_data['owner_title']),
         ("Ownership %:", business_data['ownership_percentage']),
         ("Owner Address:", business_data['owner_address'])
     ]
-    
-    for label, value in owner_details:
-        c.drawString(50, y_pos, label)
-        c.drawString(200, y_pos, value)
-        y_pos -= 25
+    y_pos = draw_detail_rows(c, y_pos, owner_details)
     
     # Authorized activities
     y_pos -= 20
@@ -95,29 +196,33 @@ def create_business_registration(filename, business_data):
     c.drawString(50, y_pos, "AUTHORIZED BUSINESS ACTIVITIES")
     
     y_pos -= 25
-    c.setFont("Helvetica", 10)
-    activities = business_data.get('activities', [])
-    for activity in activities:
-        c.drawString(70, y_pos, f"• {activity}")
-        y_pos -= 20
+    activities = c.beginText(70, y_pos)
+    activities.setFont("Helvetica", 10, 20)
+    for activity in business_data.get('activities', []):
+        activities.textLine(f"• {activity}")
+    c.drawText(activities)
     
     # Footer
-    c.setFont("Helvetica", 8)
-    c.drawString(50, 80, "This certificate is valid only for the business activities listed above.")
-    c.drawString(50, 65, "Any changes to business information must be reported within 30 days.")
-    c.drawString(50, 50, "This is a sample document for testing purposes only")
-    c.drawString(50, 35, "All information contained herein is fictional")
+    footer = c.beginText(50, 80)
+    footer.setFont("Helvetica", 8, 15)
+    footer.textLine("This certificate is valid only for the business activities listed above.")
+    footer.textLine("Any changes to business information must be reported within 30 days.")
+    footer.textLine("This is a sample document for testing purposes only")
+    footer.textLine("All information contained herein is fictional")
+    c.drawText(footer)
     
     c.save()
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_financial_statement(filename, financial_data):
     """Create a financial statement document"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
     story = []
+    money = _money_fields(financial_data, _FINANCIAL_MONEY_FIELDS)
     
     # Title
-    title = Paragraph("FINANCIAL STATEMENT", styles['Title'])
+    title = Paragraph("FINANCIAL STATEMENT", _TITLE)
     story.append(title)
     story.append(Spacer(1, 12))
     
@@ -130,146 +235,109 @@ def create_financial_statement(filename, financial_data):
         ['CPA Firm:', financial_data['cpa_firm']]
     ]
     
-    info_table = Table(company_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table = label_value_table(company_info, 11, 8)
     story.append(info_table)
     story.append(Spacer(1, 20))
     
     # Balance Sheet
-    balance_title = Paragraph("BALANCE SHEET", styles['Heading2'])
+    balance_title = Paragraph("BALANCE SHEET", _H2)
     story.append(balance_title)
     
     # Assets
-    assets_title = Paragraph("ASSETS", styles['Heading3'])
+    assets_title = Paragraph("ASSETS", _H3)
     story.append(assets_title)
     
     assets_data = [
         ['Current Assets', '', ''],
-        ['Cash and Cash Equivalents', '', f"${financial_data['cash']:,}"],
-        ['Accounts Receivable', '', f"${financial_data['accounts_receivable']:,}"],
-        ['Inventory', '', f"${financial_data['inventory']:,}"],
-        ['Prepaid Expenses', '', f"${financial_data['prepaid_expenses']:,}"],
-        ['Total Current Assets', '', f"${financial_data['total_current_assets']:,}"],
+        ['Cash and Cash Equivalents', '', money['cash']],
+        ['Accounts Receivable', '', money['accounts_receivable']],
+        ['Inventory', '', money['inventory']],
+        ['Prepaid Expenses', '', money['prepaid_expenses']],
+        ['Total Current Assets', '', money['total_current_assets']],
         ['', '', ''],
         ['Fixed Assets', '', ''],
-        ['Property, Plant & Equipment', '', f"${financial_data['ppe']:,}"],
-        ['Less: Accumulated Depreciation', '', f"(${financial_data['accumulated_depreciation']:,})"],
-        ['Net Fixed Assets', '', f"${financial_data['net_fixed_assets']:,}"],
+        ['Property, Plant & Equipment', '', money['ppe']],
+        ['Less: Accumulated Depreciation', '', f"({money['accumulated_depreciation']})"],
+        ['Net Fixed Assets', '', money['net_fixed_assets']],
         ['', '', ''],
-        ['TOTAL ASSETS', '', f"${financial_data['total_assets']:,}"]
+        ['TOTAL ASSETS', '', money['total_assets']]
     ]
     
     assets_table = Table(assets_data, colWidths=[2.5*inch, 1*inch, 2.5*inch])
-    assets_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 7), (0, 7), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
-        ('LINEBELOW', (0, -1), (-1, -1), 2, colors.black)
-    ]))
+    assets_table.setStyle(_ASSETS_TABLE_STYLE)
     story.append(assets_table)
     story.append(Spacer(1, 20))
     
     # Liabilities and Equity
-    liabilities_title = Paragraph("LIABILITIES AND EQUITY", styles['Heading3'])
+    liabilities_title = Paragraph("LIABILITIES AND EQUITY", _H3)
     story.append(liabilities_title)
     
     liabilities_data = [
         ['Current Liabilities', '', ''],
-        ['Accounts Payable', '', f"${financial_data['accounts_payable']:,}"],
-        ['Accrued Expenses', '', f"${financial_data['accrued_expenses']:,}"],
-        ['Short-term Debt', '', f"${financial_data['short_term_debt']:,}"],
-        ['Total Current Liabilities', '', f"${financial_data['total_current_liabilities']:,}"],
+        ['Accounts Payable', '', money['accounts_payable']],
+        ['Accrued Expenses', '', money['accrued_expenses']],
+        ['Short-term Debt', '', money['short_term_debt']],
+        ['Total Current Liabilities', '', money['total_current_liabilities']],
         ['', '', ''],
-        ['Long-term Debt', '', f"${financial_data['long_term_debt']:,}"],
-        ['Total Liabilities', '', f"${financial_data['total_liabilities']:,}"],
+        ['Long-term Debt', '', money['long_term_debt']],
+        ['Total Liabilities', '', money['total_liabilities']],
         ['', '', ''],
         ['Shareholders\' Equity', '', ''],
-        ['Common Stock', '', f"${financial_data['common_stock']:,}"],
-        ['Retained Earnings', '', f"${financial_data['retained_earnings']:,}"],
-        ['Total Shareholders\' Equity', '', f"${financial_data['total_equity']:,}"],
+        ['Common Stock', '', money['common_stock']],
+        ['Retained Earnings', '', money['retained_earnings']],
+        ['Total Shareholders\' Equity', '', money['total_equity']],
         ['', '', ''],
-        ['TOTAL LIABILITIES & EQUITY', '', f"${financial_data['total_liab_equity']:,}"]
+        ['TOTAL LIABILITIES & EQUITY', '', money['total_liab_equity']]
     ]
     
     liabilities_table = Table(liabilities_data, colWidths=[2.5*inch, 1*inch, 2.5*inch])
-    liabilities_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 7), (0, 7), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 9), (0, 9), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
-        ('LINEBELOW', (0, -1), (-1, -1), 2, colors.black)
-    ]))
+    liabilities_table.setStyle(_LIABILITIES_TABLE_STYLE)
     story.append(liabilities_table)
     story.append(Spacer(1, 30))
     
     # Income Statement
-    income_title = Paragraph("INCOME STATEMENT", styles['Heading2'])
+    income_title = Paragraph("INCOME STATEMENT", _H2)
     story.append(income_title)
     
     income_data = [
-        ['Revenue', '', f"${financial_data['revenue']:,}"],
-        ['Cost of Goods Sold', '', f"${financial_data['cogs']:,}"],
-        ['Gross Profit', '', f"${financial_data['gross_profit']:,}"],
+        ['Revenue', '', money['revenue']],
+        ['Cost of Goods Sold', '', money['cogs']],
+        ['Gross Profit', '', money['gross_profit']],
         ['', '', ''],
         ['Operating Expenses', '', ''],
-        ['Salaries and Benefits', '', f"${financial_data['salaries']:,}"],
-        ['Rent and Utilities', '', f"${financial_data['rent_utilities']:,}"],
-        ['Marketing and Advertising', '', f"${financial_data['marketing']:,}"],
-        ['Professional Services', '', f"${financial_data['professional_services']:,}"],
-        ['Other Operating Expenses', '', f"${financial_data['other_expenses']:,}"],
-        ['Total Operating Expenses', '', f"${financial_data['total_operating_expenses']:,}"],
+        ['Salaries and Benefits', '', money['salaries']],
+        ['Rent and Utilities', '', money['rent_utilities']],
+        ['Marketing and Advertising', '', money['marketing']],
+        ['Professional Services', '', money['professional_services']],
+        ['Other Operating Expenses', '', money['other_expenses']],
+        ['Total Operating Expenses', '', money['total_operating_expenses']],
         ['', '', ''],
-        ['Operating Income', '', f"${financial_data['operating_income']:,}"],
-        ['Interest Expense', '', f"${financial_data['interest_expense']:,}"],
-        ['Net Income Before Taxes', '', f"${financial_data['income_before_taxes']:,}"],
-        ['Income Tax Expense', '', f"${financial_data['tax_expense']:,}"],
-        ['NET INCOME', '', f"${financial_data['net_income']:,}"]
+        ['Operating Income', '', money['operating_income']],
+        ['Interest Expense', '', money['interest_expense']],
+        ['Net Income Before Taxes', '', money['income_before_taxes']],
+        ['Income Tax Expense', '', money['tax_expense']],
+        ['NET INCOME', '', money['net_income']]
     ]
     
     income_table = Table(income_data, colWidths=[2.5*inch, 1*inch, 2.5*inch])
-    income_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('FONTNAME', (0, 4), (0, 4), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black),
-        ('LINEBELOW', (0, -1), (-1, -1), 2, colors.black)
-    ]))
+    income_table.setStyle(_INCOME_TABLE_STYLE)
     story.append(income_table)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
-    story.append(Spacer(1, 30))
-    story.append(footer)
+    story.extend(_FOOTER_FLOWABLES)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_liability_policy(filename, policy_data):
     """Create a liability insurance policy template"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
     story = []
+    money = _money_fields(policy_data, _POLICY_MONEY_FIELDS)
     
     # Title
-    title = Paragraph("GENERAL LIABILITY INSURANCE POLICY", styles['Title'])
+    title = Paragraph("GENERAL LIABILITY INSURANCE POLICY", _TITLE)
     story.append(title)
     story.append(Spacer(1, 12))
     
@@ -282,18 +350,12 @@ def create_liability_policy(filename, policy_data):
         ['Issue Date:', policy_data['issue_date']]
     ]
     
-    info_table = Table(policy_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table = label_value_table(policy_info, 11, 8)
     story.append(info_table)
     story.append(Spacer(1, 20))
     
     # Named insured
-    insured_title = Paragraph("NAMED INSURED", styles['Heading2'])
+    insured_title = Paragraph("NAMED INSURED", _H2)
     story.append(insured_title)
     
     insured_info = [
@@ -304,83 +366,52 @@ def create_liability_policy(filename, policy_data):
         ['Industry Classification:', policy_data['industry_classification']]
     ]
     
-    insured_table = Table(insured_info, colWidths=[2*inch, 4*inch])
-    insured_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    insured_table = label_value_table(insured_info)
     story.append(insured_table)
     story.append(Spacer(1, 20))
     
     # Coverage details
-    coverage_title = Paragraph("COVERAGE DETAILS", styles['Heading2'])
+    coverage_title = Paragraph("COVERAGE DETAILS", _H2)
     story.append(coverage_title)
     
     coverage_data = [
         ['Coverage', 'Each Occurrence', 'General Aggregate', 'Premium'],
-        ['Bodily Injury & Property Damage', f"${policy_data['each_occurrence']:,}", f"${policy_data['general_aggregate']:,}", f"${policy_data['bd_pd_premium']:,}"],
-        ['Personal & Advertising Injury', f"${policy_data['personal_injury_limit']:,}", 'Included in General Aggregate', f"${policy_data['personal_injury_premium']:,}"],
-        ['Products-Completed Operations', f"${policy_data['products_ops_occurrence']:,}", f"${policy_data['products_ops_aggregate']:,}", f"${policy_data['products_ops_premium']:,}"],
-        ['Medical Expenses', f"${policy_data['medical_expenses']:,}", 'N/A', f"${policy_data['medical_premium']:,}"],
-        ['', '', 'Total Annual Premium:', f"${policy_data['total_premium']:,}"]
+        ['Bodily Injury & Property Damage', money['each_occurrence'], money['general_aggregate'], money['bd_pd_premium']],
+        ['Personal & Advertising Injury', money['personal_injury_limit'], 'Included in General Aggregate', money['personal_injury_premium']],
+        ['Products-Completed Operations', money['products_ops_occurrence'], money['products_ops_aggregate'], money['products_ops_premium']],
+        ['Medical Expenses', money['medical_expenses'], 'N/A', money['medical_premium']],
+        ['', '', 'Total Annual Premium:', money['total_premium']]
     ]
     
     coverage_table = Table(coverage_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch, 1*inch])
-    coverage_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -2), 1, colors.black),
-        ('LINEABOVE', (2, -1), (-1, -1), 2, colors.black)
-    ]))
+    coverage_table.setStyle(TOTAL_ROW_TABLE_STYLE)
     story.append(coverage_table)
     story.append(Spacer(1, 20))
     
     # Deductibles
-    deductible_title = Paragraph("DEDUCTIBLES", styles['Heading2'])
+    deductible_title = Paragraph("DEDUCTIBLES", _H2)
     story.append(deductible_title)
     
     deductible_text = f"""
-    Per Occurrence Deductible: ${policy_data['deductible']:,}
+    Per Occurrence Deductible: {money['deductible']}
     
     The deductible applies to each covered occurrence. The insured is responsible for the 
     deductible amount before coverage begins.
     """
     
-    deductible_para = Paragraph(deductible_text, styles['Normal'])
+    deductible_para = Paragraph(deductible_text, _NORMAL)
     story.append(deductible_para)
     story.append(Spacer(1, 20))
     
     # Key exclusions
-    exclusions_title = Paragraph("KEY EXCLUSIONS", styles['Heading2'])
+    exclusions_title = Paragraph("KEY EXCLUSIONS", _H2)
     story.append(exclusions_title)
     
-    exclusions_text = """
-    This policy does not cover claims arising from:
-    
-    • Professional services (requires separate Professional Liability coverage)
-    • Cyber/data breach incidents (requires separate Cyber Liability coverage)
-    • Employment practices (requires separate Employment Practices Liability coverage)
-    • Pollution incidents (requires separate Environmental coverage)
-    • Aircraft, auto, or watercraft operations (require separate coverage)
-    • Workers' compensation (requires separate coverage)
-    • Intentional criminal acts
-    
-    This is a summary only. Please refer to the complete policy for all terms and conditions.
-    """
-    
-    exclusions_para = Paragraph(exclusions_text, styles['Normal'])
-    story.append(exclusions_para)
+    story.append(_EXCLUSIONS_PARA)
     story.append(Spacer(1, 20))
     
     # Claims reporting
-    claims_title = Paragraph("CLAIMS REPORTING", styles['Heading2'])
+    claims_title = Paragraph("CLAIMS REPORTING", _H2)
     story.append(claims_title)
     
     claims_text = f"""
@@ -393,25 +424,24 @@ def create_liability_policy(filename, policy_data):
     Prompt reporting is essential for proper claims handling.
     """
     
-    claims_para = Paragraph(claims_text, styles['Normal'])
+    claims_para = Paragraph(claims_text, _NORMAL)
     story.append(claims_para)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
-    story.append(Spacer(1, 30))
-    story.append(footer)
+    story.extend(_FOOTER_FLOWABLES)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_contract_document(filename, contract_data):
     """Create a business contract document"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
     story = []
+    money = _money_fields(contract_data, _CONTRACT_MONEY_FIELDS)
     
     # Title
-    title = Paragraph("SERVICE AGREEMENT CONTRACT", styles['Title'])
+    title = Paragraph("SERVICE AGREEMENT CONTRACT", _TITLE)
     story.append(title)
     story.append(Spacer(1, 12))
     
@@ -420,25 +450,19 @@ def create_contract_document(filename, contract_data):
         ['Contract Number:', contract_data['contract_number']],
         ['Effective Date:', contract_data['effective_date']],
         ['Contract Term:', contract_data['contract_term']],
-        ['Total Contract Value:', f"${contract_data['contract_value']:,}"]
+        ['Total Contract Value:', money['contract_value']]
     ]
     
-    info_table = Table(contract_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table = label_value_table(contract_info, 11, 8)
     story.append(info_table)
     story.append(Spacer(1, 20))
     
     # Parties
-    parties_title = Paragraph("CONTRACTING PARTIES", styles['Heading2'])
+    parties_title = Paragraph("CONTRACTING PARTIES", _H2)
     story.append(parties_title)
     
     # Service provider
-    provider_title = Paragraph("Service Provider:", styles['Heading3'])
+    provider_title = Paragraph("Service Provider:", _H3)
     story.append(provider_title)
     
     provider_info = [
@@ -449,18 +473,12 @@ def create_contract_document(filename, contract_data):
         ['Email:', contract_data['provider_email']]
     ]
     
-    provider_table = Table(provider_info, colWidths=[1.5*inch, 4.5*inch])
-    provider_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    provider_table = label_value_table(provider_info, col_widths=(1.5*inch, 4.5*inch))
     story.append(provider_table)
     story.append(Spacer(1, 10))
     
     # Client
-    client_title = Paragraph("Client:", styles['Heading3'])
+    client_title = Paragraph("Client:", _H3)
     story.append(client_title)
     
     client_info = [
@@ -471,18 +489,12 @@ def create_contract_document(filename, contract_data):
         ['Email:', contract_data['client_email']]
     ]
     
-    client_table = Table(client_info, colWidths=[1.5*inch, 4.5*inch])
-    client_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    client_table = label_value_table(client_info, col_widths=(1.5*inch, 4.5*inch))
     story.append(client_table)
     story.append(Spacer(1, 20))
     
     # Scope of work
-    scope_title = Paragraph("SCOPE OF WORK", styles['Heading2'])
+    scope_title = Paragraph("SCOPE OF WORK", _H2)
     story.append(scope_title)
     
     scope_text = f"""
@@ -496,60 +508,50 @@ def create_contract_document(filename, contract_data):
     Expected completion date: {contract_data['completion_date']}
     """
     
-    scope_para = Paragraph(scope_text, styles['Normal'])
+    scope_para = Paragraph(scope_text, _NORMAL)
     story.append(scope_para)
     story.append(Spacer(1, 20))
     
     # Payment terms
-    payment_title = Paragraph("PAYMENT TERMS", styles['Heading2'])
+    payment_title = Paragraph("PAYMENT TERMS", _H2)
     story.append(payment_title)
     
     payment_data = [
         ['Payment Schedule', 'Amount', 'Due Date'],
-        ['Initial Payment', f"${contract_data['initial_payment']:,}", contract_data['initial_due_date']],
-        ['Progress Payment 1', f"${contract_data['progress_payment_1']:,}", contract_data['progress_due_1']],
-        ['Progress Payment 2', f"${contract_data['progress_payment_2']:,}", contract_data['progress_due_2']],
-        ['Final Payment', f"${contract_data['final_payment']:,}", contract_data['final_due_date']],
-        ['Total Contract Value', f"${contract_data['total_payments']:,}", '']
+        ['Initial Payment', money['initial_payment'], contract_data['initial_due_date']],
+        ['Progress Payment 1', money['progress_payment_1'], contract_data['progress_due_1']],
+        ['Progress Payment 2', money['progress_payment_2'], contract_data['progress_due_2']],
+        ['Final Payment', money['final_payment'], contract_data['final_due_date']],
+        ['Total Contract Value', money['total_payments'], '']
     ]
     
     payment_table = Table(payment_data, colWidths=[2.5*inch, 1.5*inch, 2*inch])
-    payment_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    payment_table.setStyle(_PAYMENT_TABLE_STYLE)
     story.append(payment_table)
     story.append(Spacer(1, 20))
     
     # Insurance requirements
-    insurance_title = Paragraph("INSURANCE REQUIREMENTS", styles['Heading2'])
+    insurance_title = Paragraph("INSURANCE REQUIREMENTS", _H2)
     story.append(insurance_title)
     
     insurance_text = f"""
     The Service Provider shall maintain the following minimum insurance coverage:
     
-    • General Liability: ${contract_data['required_gl_coverage']:,} per occurrence
-    • Professional Liability: ${contract_data['required_pl_coverage']:,} per claim
+    • General Liability: {money['required_gl_coverage']} per occurrence
+    • Professional Liability: {money['required_pl_coverage']} per claim
     • Workers' Compensation: As required by state law
-    • Commercial Auto: ${contract_data['required_auto_coverage']:,} combined single limit
+    • Commercial Auto: {money['required_auto_coverage']} combined single limit
     
     The Client shall be named as an additional insured on all applicable policies.
     Certificates of Insurance must be provided before work commences.
     """
     
-    insurance_para = Paragraph(insurance_text, styles['Normal'])
+    insurance_para = Paragraph(insurance_text, _NORMAL)
     story.append(insurance_para)
     story.append(Spacer(1, 20))
     
     # Signatures
-    signature_title = Paragraph("SIGNATURES", styles['Heading2'])
+    signature_title = Paragraph("SIGNATURES", _H2)
     story.append(signature_title)
     
     signature_data = [
@@ -562,30 +564,23 @@ def create_contract_document(filename, contract_data):
     ]
     
     signature_table = Table(signature_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-    signature_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    signature_table.setStyle(_SIGNATURE_TABLE_STYLE)
     story.append(signature_table)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
-    story.append(Spacer(1, 30))
-    story.append(footer)
+    story.extend(_FOOTER_FLOWABLES)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_risk_assessment(filename, risk_data):
     """Create a risk assessment report"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
     story = []
     
     # Title
-    title = Paragraph("BUSINESS RISK ASSESSMENT REPORT", styles['Title'])
+    title = Paragraph("BUSINESS RISK ASSESSMENT REPORT", _TITLE)
     story.append(title)
     story.append(Spacer(1, 12))
     
@@ -599,18 +594,12 @@ def create_risk_assessment(filename, risk_data):
         ['Assessment Type:', risk_data['assessment_type']]
     ]
     
-    info_table = Table(assessment_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table = label_value_table(assessment_info, 11, 8)
     story.append(info_table)
     story.append(Spacer(1, 20))
     
     # Executive summary
-    summary_title = Paragraph("EXECUTIVE SUMMARY", styles['Heading2'])
+    summary_title = Paragraph("EXECUTIVE SUMMARY", _H2)
     story.append(summary_title)
     
     summary_text = f"""
@@ -623,12 +612,12 @@ def create_risk_assessment(filename, risk_data):
     Key areas of concern include {risk_data['key_concerns']} while strengths include {risk_data['strengths']}.
     """
     
-    summary_para = Paragraph(summary_text, styles['Normal'])
+    summary_para = Paragraph(summary_text, _NORMAL)
     story.append(summary_para)
     story.append(Spacer(1, 20))
     
     # Risk categories
-    categories_title = Paragraph("RISK CATEGORY ANALYSIS", styles['Heading2'])
+    categories_title = Paragraph("RISK CATEGORY ANALYSIS", _H2)
     story.append(categories_title)
     
     categories_data = [
@@ -642,20 +631,12 @@ def create_risk_assessment(filename, risk_data):
     ]
     
     categories_table = Table(categories_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1.5*inch])
-    categories_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    categories_table.setStyle(_CATEGORIES_TABLE_STYLE)
     story.append(categories_table)
     story.append(Spacer(1, 20))
     
     # Recommendations
-    recommendations_title = Paragraph("RECOMMENDATIONS", styles['Heading2'])
+    recommendations_title = Paragraph("RECOMMENDATIONS", _H2)
     story.append(recommendations_title)
     
     recommendations_text = f"""
@@ -680,12 +661,12 @@ def create_risk_assessment(filename, risk_data):
     potentially lead to more favorable insurance terms.
     """
     
-    recommendations_para = Paragraph(recommendations_text, styles['Normal'])
+    recommendations_para = Paragraph(recommendations_text, _NORMAL)
     story.append(recommendations_para)
     story.append(Spacer(1, 20))
     
     # Assessor certification
-    cert_title = Paragraph("ASSESSOR CERTIFICATION", styles['Heading2'])
+    cert_title = Paragraph("ASSESSOR CERTIFICATION", _H2)
     story.append(cert_title)
     
     cert_text = f"""
@@ -698,21 +679,18 @@ def create_risk_assessment(filename, risk_data):
     Date: {risk_data['signature_date']}
     """
     
-    cert_para = Paragraph(cert_text, styles['Normal'])
+    cert_para = Paragraph(cert_text, _NORMAL)
     story.append(cert_para)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
-    story.append(Spacer(1, 30))
-    story.append(footer)
+    story.extend(_FOOTER_FLOWABLES)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
-def generate_liability_insurance_docs():
-    """Generate all liability insurance documents"""
-    # Sample data
-    business_data = {
+def _business_data():
+    """Sample data for the business registration certificate"""
+    return {
         'registration_number': 'BRN-2024-456789',
         'issue_date': '2024-01-15',
         'expiration_date': '2025-01-15',
@@ -740,8 +718,10 @@ def generate_liability_insurance_docs():
             'Cloud computing services'
         ]
     }
-    
-    financial_data = {
+
+def _financial_data():
+    """Sample data for the financial statement"""
+    return {
         'company_name': 'TechSolutions Consulting LLC',
         'period_start': '2024-01-01',
         'period_end': '2024-12-31',
@@ -782,8 +762,10 @@ def generate_liability_insurance_docs():
         'tax_expense': 12000,
         'net_income': 43000
     }
-    
-    policy_data = {
+
+def _policy_data():
+    """Sample data for the liability policy"""
+    return {
         'policy_number': 'GL-2024-789012',
         'effective_date': '2024-01-01',
         'expiration_date': '2024-12-31',
@@ -811,8 +793,10 @@ def generate_liability_insurance_docs():
         'claims_hotline': '(800) 555-2524',
         'claims_website': 'www.metrobusiness.com/claims'
     }
-    
-    contract_data = {
+
+def _contract_data():
+    """Sample data for the service contract"""
+    return {
         'contract_number': 'SA-2024-3456',
         'effective_date': '2024-09-01',
         'contract_term': '12 months',
@@ -852,8 +836,10 @@ def generate_liability_insurance_docs():
         'client_signatory': 'Robert Johnson',
         'client_title': 'IT Director'
     }
-    
-    risk_data = {
+
+def _risk_data():
+    """Sample data for the risk assessment report"""
+    return {
         'assessment_id': 'RA-2024-7890',
         'assessment_date': '2024-08-15',
         'assessor_name': 'Michael Davis, ARM',
@@ -879,13 +865,19 @@ def generate_liability_insurance_docs():
         'assessor_certification': 'Associate in Risk Management (ARM)',
         'signature_date': '2024-08-20'
     }
-    
-    # Generate documents
-    create_business_registration('test-documents/liability-insurance/business_registration_certificate.pdf', business_data)
-    create_financial_statement('test-documents/liability-insurance/financial_statement.pdf', financial_data)
-    create_liability_policy('test-documents/liability-insurance/liability_insurance_policy.pdf', policy_data)
-    create_contract_document('test-documents/liability-insurance/service_contract.pdf', contract_data)
-    create_risk_assessment('test-documents/liability-insurance/risk_assessment_report.pdf', risk_data)
+
+# Liability documents by name, as (output file, builder, sample data factory)
+_GENERATORS = {
+    'business_registration': ('business_registration_certificate.pdf', create_business_registration, _business_data),
+    'financial_statement': ('financial_statement.pdf', create_financial_statement, _financial_data),
+    'liability_policy': ('liability_insurance_policy.pdf', create_liability_policy, _policy_data),
+    'service_contract': ('service_contract.pdf', create_contract_document, _contract_data),
+    'risk_assessment': ('risk_assessment_report.pdf', create_risk_assessment, _risk_data)
+}
+
+def generate_liability_insurance_docs(*which):
+    """Generate all liability insurance documents, or only the ones named"""
+    render_documents('test-documents/liability-insurance', _GENERATORS, which, max_workers=5)
 
 if __name__ == "__main__":
     generate_liability_insurance_docs()
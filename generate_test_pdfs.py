@@ -7,16 +7,42 @@ All content is fictional and for testing purposes only
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+import functools
+import io
 import os
 from datetime import datetime, timedelta
 import random
+from pathlib import Path
+from typing import NamedTuple
+
+from pdf_helpers import TOTAL_ROW_TABLE_STYLE, draw_detail_rows, grid_table_style, label_value_table, preload_fonts, render_documents
+
+preload_fonts("Helvetica", "Helvetica-Bold")
+
+_STYLES = getSampleStyleSheet()
+_FOOTER_STYLE = ParagraphStyle('Footer', fontSize=8, textColor=colors.grey)
+
+# Inspection checklist rows; every sample vehicle passes, so the table is fixed
+_INSPECTION_ITEMS = (
+    ('Component', 'Status', 'Notes'),
+    ('Brakes', 'PASS', 'Good condition'),
+    ('Lights', 'PASS', 'All functional'),
+    ('Tires', 'PASS', '7/32" tread depth'),
+    ('Steering', 'PASS', 'No play detected'),
+    ('Exhaust', 'PASS', 'Secure mounting'),
+    ('Mirrors', 'PASS', 'Clean and secure'),
+    ('Windshield', 'PASS', 'No cracks'),
+    ('Horn', 'PASS', 'Audible'),
+    ('Seat Belts', 'PASS', 'Functional'),
+)
 
 def create_vehicle_registration(filename, vehicle_data):
     """Create a sample vehicle registration certificate"""
-    c = canvas.Canvas(filename, pagesize=letter)
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
     width, height = letter
     
     # Header
@@ -27,8 +53,8 @@ def create_vehicle_registration(filename, vehicle_data):
     
     # Document number
     c.setFont("Helvetica", 10)
-    c.drawString(width - 200, height - 50, f"Document No: {vehicle_data['doc_number']}")
-    c.drawString(width - 200, height - 70, f"Issue Date: {vehicle_data['issue_date']}")
+    c.drawString(width - 200, height - 50, f"Document No: {vehicle_data.doc_number}")
+    c.drawString(width - 200, height - 70, f"Issue Date: {vehicle_data.issue_date}")
     
     # Vehicle details
     y_pos = height - 150
@@ -36,22 +62,17 @@ def create_vehicle_registration(filename, vehicle_data):
     c.drawString(50, y_pos, "VEHICLE INFORMATION")
     
     y_pos -= 30
-    c.setFont("Helvetica", 11)
     details = [
-        ("Registration Number:", vehicle_data['reg_number']),
-        ("Vehicle Make:", vehicle_data['make']),
-        ("Vehicle Model:", vehicle_data['model']),
-        ("Year of Manufacture:", vehicle_data['year']),
-        ("Engine Number:", vehicle_data['engine_number']),
-        ("Chassis Number:", vehicle_data['chassis_number']),
-        ("Color:", vehicle_data['color']),
-        ("Fuel Type:", vehicle_data['fuel_type'])
+        ("Registration Number:", vehicle_data.reg_number),
+        ("Vehicle Make:", vehicle_data.make),
+        ("Vehicle Model:", vehicle_data.model),
+        ("Year of Manufacture:", vehicle_data.year),
+        ("Engine Number:", vehicle_data.engine_number),
+        ("Chassis Number:", vehicle_data.chassis_number),
+        ("Color:", vehicle_data.color),
+        ("Fuel Type:", vehicle_data.fuel_type)
     ]
-    
-    for label, value in details:
-        c.drawString(50, y_pos, label)
-        c.drawString(200, y_pos, value)
-        y_pos -= 25
+    y_pos = draw_detail_rows(c, y_pos, details)
     
     # Owner details
     y_pos -= 20
@@ -59,29 +80,28 @@ def create_vehicle_registration(filename, vehicle_data):
     c.drawString(50, y_pos, "OWNER INFORMATION")
     
     y_pos -= 30
-    c.setFont("Helvetica", 11)
     owner_details = [
-        ("Full Name:", vehicle_data['owner_name']),
-        ("Address:", vehicle_data['owner_address']),
-        ("ID Number:", vehicle_data['owner_id']),
-        ("Phone:", vehicle_data['owner_phone'])
+        ("Full Name:", vehicle_data.owner_name),
+        ("Address:", vehicle_data.owner_address),
+        ("ID Number:", vehicle_data.owner_id),
+        ("Phone:", vehicle_data.owner_phone)
     ]
-    
-    for label, value in owner_details:
-        c.drawString(50, y_pos, label)
-        c.drawString(200, y_pos, value)
-        y_pos -= 25
+    y_pos = draw_detail_rows(c, y_pos, owner_details)
     
     # Footer
-    c.setFont("Helvetica", 8)
-    c.drawString(50, 50, "This is a sample document for testing purposes only")
-    c.drawString(50, 35, "All information contained herein is fictional")
+    footer = c.beginText(50, 50)
+    footer.setFont("Helvetica", 8, 15)
+    footer.textLine("This is a sample document for testing purposes only")
+    footer.textLine("All information contained herein is fictional")
+    c.drawText(footer)
     
     c.save()
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_drivers_license(filename, driver_data):
     """Create a sample driver's license"""
-    c = canvas.Canvas(filename, pagesize=(4*inch, 2.5*inch))
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=(4*inch, 2.5*inch))
     width, height = 4*inch, 2.5*inch
     
     # Front side
@@ -92,15 +112,20 @@ def create_drivers_license(filename, driver_data):
     c.setFont("Helvetica-Bold", 10)
     c.drawString(10, height - 20, "DRIVER LICENSE")
     
-    c.setFont("Helvetica", 8)
-    c.drawString(10, height - 40, f"License No: {driver_data['license_number']}")
-    c.drawString(10, height - 55, f"Class: {driver_data['license_class']}")
-    c.drawString(10, height - 70, f"Expires: {driver_data['expiry_date']}")
+    license_info = c.beginText(10, height - 40)
+    license_info.setFont("Helvetica", 8, 15)
+    license_info.textLine(f"License No: {driver_data.license_number}")
+    license_info.textLine(f"Class: {driver_data.license_class}")
+    license_info.textLine(f"Expires: {driver_data.expiry_date}")
+    c.drawText(license_info)
     
     # Driver info
-    c.drawString(10, height - 95, f"Name: {driver_data['full_name']}")
-    c.drawString(10, height - 110, f"DOB: {driver_data['date_of_birth']}")
-    c.drawString(10, height - 125, f"Address: {driver_data['address']}")
+    driver_info = c.beginText(10, height - 95)
+    driver_info.setFont("Helvetica", 8, 15)
+    driver_info.textLine(f"Name: {driver_data.full_name}")
+    driver_info.textLine(f"DOB: {driver_data.date_of_birth}")
+    driver_info.textLine(f"Address: {driver_data.address}")
+    c.drawText(driver_info)
     
     # Photo placeholder
     c.setFillColor(colors.grey)
@@ -119,21 +144,23 @@ def create_drivers_license(filename, driver_data):
     c.setFont("Helvetica-Bold", 8)
     c.drawString(10, height - 20, "RESTRICTIONS & ENDORSEMENTS")
     
-    c.setFont("Helvetica", 7)
-    restrictions = driver_data.get('restrictions', ['NONE'])
-    y_pos = height - 40
-    for restriction in restrictions:
-        c.drawString(10, y_pos, f"• {restriction}")
-        y_pos -= 15
+    restrictions = c.beginText(10, height - 40)
+    restrictions.setFont("Helvetica", 7, 15)
+    for restriction in driver_data.restrictions:
+        restrictions.textLine(f"• {restriction}")
+    c.drawText(restrictions)
     
+    c.setFont("Helvetica", 7)
     c.drawString(10, 20, "This is a sample document for testing purposes only")
     
     c.save()
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_vehicle_inspection_report(filename, inspection_data):
     """Create a vehicle inspection report"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
+    styles = _STYLES
     story = []
     
     # Title
@@ -143,20 +170,14 @@ def create_vehicle_inspection_report(filename, inspection_data):
     
     # Inspection details
     inspection_info = [
-        ['Inspection Date:', inspection_data['inspection_date']],
-        ['Inspector:', inspection_data['inspector_name']],
-        ['License No:', inspection_data['inspector_license']],
-        ['Station:', inspection_data['station_name']],
-        ['Certificate No:', inspection_data['certificate_number']]
+        ['Inspection Date:', inspection_data.inspection_date],
+        ['Inspector:', inspection_data.inspector_name],
+        ['License No:', inspection_data.inspector_license],
+        ['Station:', inspection_data.station_name],
+        ['Certificate No:', inspection_data.certificate_number]
     ]
     
-    info_table = Table(inspection_info, colWidths=[2*inch, 3*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    info_table = label_value_table(inspection_info, col_widths=(2*inch, 3*inch))
     story.append(info_table)
     story.append(Spacer(1, 20))
     
@@ -165,20 +186,14 @@ def create_vehicle_inspection_report(filename, inspection_data):
     story.append(vehicle_title)
     
     vehicle_info = [
-        ['Registration No:', inspection_data['reg_number']],
-        ['Make/Model:', f"{inspection_data['make']} {inspection_data['model']}"],
-        ['Year:', inspection_data['year']],
-        ['Mileage:', inspection_data['mileage']],
-        ['VIN:', inspection_data['vin']]
+        ['Registration No:', inspection_data.reg_number],
+        ['Make/Model:', f"{inspection_data.make} {inspection_data.model}"],
+        ['Year:', inspection_data.year],
+        ['Mileage:', inspection_data.mileage],
+        ['VIN:', inspection_data.vin]
     ]
     
-    vehicle_table = Table(vehicle_info, colWidths=[2*inch, 3*inch])
-    vehicle_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    vehicle_table = label_value_table(vehicle_info, col_widths=(2*inch, 3*inch))
     story.append(vehicle_table)
     story.append(Spacer(1, 20))
     
@@ -186,48 +201,28 @@ def create_vehicle_inspection_report(filename, inspection_data):
     results_title = Paragraph("INSPECTION RESULTS", styles['Heading2'])
     story.append(results_title)
     
-    inspection_items = [
-        ['Component', 'Status', 'Notes'],
-        ['Brakes', 'PASS', 'Good condition'],
-        ['Lights', 'PASS', 'All functional'],
-        ['Tires', 'PASS', '7/32" tread depth'],
-        ['Steering', 'PASS', 'No play detected'],
-        ['Exhaust', 'PASS', 'Secure mounting'],
-        ['Mirrors', 'PASS', 'Clean and secure'],
-        ['Windshield', 'PASS', 'No cracks'],
-        ['Horn', 'PASS', 'Audible'],
-        ['Seat Belts', 'PASS', 'Functional']
-    ]
-    
-    results_table = Table(inspection_items, colWidths=[2*inch, 1*inch, 2.5*inch])
-    results_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    results_table = Table(_INSPECTION_ITEMS, colWidths=[2*inch, 1*inch, 2.5*inch])
+    results_table.setStyle(grid_table_style('CENTER'))
     story.append(results_table)
     story.append(Spacer(1, 20))
     
     # Conclusion
-    conclusion = Paragraph(f"<b>OVERALL RESULT: {inspection_data['result']}</b>", styles['Normal'])
+    conclusion = Paragraph(f"<b>OVERALL RESULT: {inspection_data.result}</b>", styles['Normal'])
     story.append(conclusion)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
+    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", _FOOTER_STYLE)
     story.append(Spacer(1, 30))
     story.append(footer)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_insurance_policy(filename, policy_data):
     """Create an insurance policy document"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
+    styles = _STYLES
     story = []
     
     # Header
@@ -237,20 +232,14 @@ def create_insurance_policy(filename, policy_data):
     
     # Policy details
     policy_info = [
-        ['Policy Number:', policy_data['policy_number']],
-        ['Policy Period:', f"{policy_data['start_date']} to {policy_data['end_date']}"],
-        ['Insurance Company:', policy_data['company_name']],
-        ['Agent:', policy_data['agent_name']],
-        ['Issue Date:', policy_data['issue_date']]
+        ['Policy Number:', policy_data.policy_number],
+        ['Policy Period:', f"{policy_data.start_date} to {policy_data.end_date}"],
+        ['Insurance Company:', policy_data.company_name],
+        ['Agent:', policy_data.agent_name],
+        ['Issue Date:', policy_data.issue_date]
     ]
     
-    info_table = Table(policy_info, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table = label_value_table(policy_info, 11, 8)
     story.append(info_table)
     story.append(Spacer(1, 20))
     
@@ -259,20 +248,14 @@ def create_insurance_policy(filename, policy_data):
     story.append(insured_title)
     
     insured_info = [
-        ['Name:', policy_data['insured_name']],
-        ['Address:', policy_data['insured_address']],
-        ['Phone:', policy_data['insured_phone']],
-        ['Email:', policy_data['insured_email']],
-        ['License Number:', policy_data['license_number']]
+        ['Name:', policy_data.insured_name],
+        ['Address:', policy_data.insured_address],
+        ['Phone:', policy_data.insured_phone],
+        ['Email:', policy_data.insured_email],
+        ['License Number:', policy_data.license_number]
     ]
     
-    insured_table = Table(insured_info, colWidths=[2*inch, 4*inch])
-    insured_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    insured_table = label_value_table(insured_info)
     story.append(insured_table)
     story.append(Spacer(1, 20))
     
@@ -281,19 +264,13 @@ def create_insurance_policy(filename, policy_data):
     story.append(vehicle_title)
     
     vehicle_info = [
-        ['Year/Make/Model:', f"{policy_data['vehicle_year']} {policy_data['vehicle_make']} {policy_data['vehicle_model']}"],
-        ['VIN:', policy_data['vehicle_vin']],
-        ['License Plate:', policy_data['license_plate']],
-        ['Use:', policy_data['vehicle_use']]
+        ['Year/Make/Model:', f"{policy_data.vehicle_year} {policy_data.vehicle_make} {policy_data.vehicle_model}"],
+        ['VIN:', policy_data.vehicle_vin],
+        ['License Plate:', policy_data.license_plate],
+        ['Use:', policy_data.vehicle_use]
     ]
     
-    vehicle_table = Table(vehicle_info, colWidths=[2*inch, 4*inch])
-    vehicle_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    vehicle_table = label_value_table(vehicle_info)
     story.append(vehicle_table)
     story.append(Spacer(1, 20))
     
@@ -312,31 +289,22 @@ def create_insurance_policy(filename, policy_data):
     ]
     
     coverage_table = Table(coverage_data, colWidths=[2.5*inch, 1.5*inch, 1*inch, 1*inch])
-    coverage_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -2), 1, colors.black),
-        ('LINEABOVE', (2, -1), (-1, -1), 2, colors.black)
-    ]))
+    coverage_table.setStyle(TOTAL_ROW_TABLE_STYLE)
     story.append(coverage_table)
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
+    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", _FOOTER_STYLE)
     story.append(Spacer(1, 30))
     story.append(footer)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
 
 def create_claim_form(filename, claim_data, is_blank=False):
     """Create a claim form (blank or completed)"""
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=letter)
+    styles = _STYLES
     story = []
     
     # Title
@@ -344,91 +312,50 @@ def create_claim_form(filename, claim_data, is_blank=False):
     story.append(title)
     story.append(Spacer(1, 12))
     
-    if not is_blank:
-        story.append(Paragraph(f"Claim Number: {claim_data['claim_number']}", styles['Normal']))
-        story.append(Paragraph(f"Date of Report: {claim_data['report_date']}", styles['Normal']))
+    # The blank form is filled from a record of underscore rules
+    claim = _BLANK_CLAIM if is_blank else claim_data
+    if is_blank:
+        description = "<br/>".join(["Description of Incident:"] + ["_" * 64] * 3)
     else:
-        story.append(Paragraph("Claim Number: ________________________", styles['Normal']))
-        story.append(Paragraph("Date of Report: ________________________", styles['Normal']))
+        description = f"Description: {claim.description}"
     
+    story.append(Paragraph(f"Claim Number: {claim.claim_number}<br/>Date of Report: {claim.report_date}", styles['Normal']))
     story.append(Spacer(1, 20))
     
     # Section 1: Policy Information
     section1 = Paragraph("SECTION 1: POLICY INFORMATION", styles['Heading2'])
     story.append(section1)
-    
-    if not is_blank:
-        policy_info = [
-            f"Policy Number: {claim_data['policy_number']}",
-            f"Insured Name: {claim_data['insured_name']}",
-            f"Phone Number: {claim_data['phone']}",
-            f"Email: {claim_data['email']}"
-        ]
-        for info in policy_info:
-            story.append(Paragraph(info, styles['Normal']))
-    else:
-        blank_fields = [
-            "Policy Number: ________________________________________________",
-            "Insured Name: ________________________________________________",
-            "Phone Number: ________________________________________________",
-            "Email: ________________________________________________"
-        ]
-        for field in blank_fields:
-            story.append(Paragraph(field, styles['Normal']))
-    
+    policy_info = [
+        f"Policy Number: {claim.policy_number}",
+        f"Insured Name: {claim.insured_name}",
+        f"Phone Number: {claim.phone}",
+        f"Email: {claim.email}"
+    ]
+    story.append(Paragraph("<br/>".join(policy_info), styles['Normal']))
     story.append(Spacer(1, 20))
     
     # Section 2: Incident Details
     section2 = Paragraph("SECTION 2: INCIDENT DETAILS", styles['Heading2'])
     story.append(section2)
-    
-    if not is_blank:
-        incident_info = [
-            f"Date of Loss: {claim_data['loss_date']}",
-            f"Time of Loss: {claim_data['loss_time']}",
-            f"Location: {claim_data['location']}",
-            f"Description: {claim_data['description']}"
-        ]
-        for info in incident_info:
-            story.append(Paragraph(info, styles['Normal']))
-    else:
-        incident_fields = [
-            "Date of Loss: ________________________________________________",
-            "Time of Loss: ________________________________________________",
-            "Location: ________________________________________________",
-            "Description of Incident:",
-            "________________________________________________________________",
-            "________________________________________________________________",
-            "________________________________________________________________"
-        ]
-        for field in incident_fields:
-            story.append(Paragraph(field, styles['Normal']))
-    
+    incident_info = [
+        f"Date of Loss: {claim.loss_date}",
+        f"Time of Loss: {claim.loss_time}",
+        f"Location: {claim.location}",
+        description
+    ]
+    story.append(Paragraph("<br/>".join(incident_info), styles['Normal']))
     story.append(Spacer(1, 20))
     
     # Section 3: Vehicle Information
     section3 = Paragraph("SECTION 3: VEHICLE INFORMATION", styles['Heading2'])
     story.append(section3)
-    
-    if not is_blank:
-        vehicle_info = [
-            f"Year/Make/Model: {claim_data['vehicle']}",
-            f"License Plate: {claim_data['license_plate']}",
-            f"VIN: {claim_data['vin']}",
-            f"Estimated Damage: ${claim_data['estimated_damage']}"
-        ]
-        for info in vehicle_info:
-            story.append(Paragraph(info, styles['Normal']))
-    else:
-        vehicle_fields = [
-            "Year/Make/Model: ________________________________________________",
-            "License Plate: ________________________________________________",
-            "VIN: ________________________________________________",
-            "Estimated Damage: $________________________________________________"
-        ]
-        for field in vehicle_fields:
-            story.append(Paragraph(field, styles['Normal']))
-    
+    vehicle_info = [
+        f"Year/Make/Model: {claim.vehicle}",
+        f"License Plate: {claim.license_plate}",
+        f"VIN: {claim.vin}",
+        f"Estimated Damage: ${claim.estimated_damage}"
+    ]
+    story.append(Paragraph("<br/>".join(vehicle_info), styles['Normal']))
     story.append(Spacer(1, 30))
     
     # Signature section
@@ -439,141 +366,240 @@ def create_claim_form(filename, claim_data, is_blank=False):
     story.append(Paragraph(cert_text, styles['Normal']))
     story.append(Spacer(1, 20))
     
-    if not is_blank:
-        story.append(Paragraph(f"Signature: {claim_data['signature']}", styles['Normal']))
-        story.append(Paragraph(f"Date: {claim_data['signature_date']}", styles['Normal']))
-    else:
-        story.append(Paragraph("Signature: ________________________________________________", styles['Normal']))
-        story.append(Paragraph("Date: ________________________________________________", styles['Normal']))
+    story.append(Paragraph(f"Signature: {claim.signature}<br/>Date: {claim.signature_date}", styles['Normal']))
     
     # Footer
-    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", 
-                      ParagraphStyle('Footer', fontSize=8, textColor=colors.grey))
+    footer = Paragraph("This is a sample document for testing purposes only. All information is fictional.", _FOOTER_STYLE)
     story.append(Spacer(1, 30))
     story.append(footer)
     
     doc.build(story)
+    Path(filename).write_bytes(buf.getbuffer())
+
+# Sample data records, one per document type
+class VehicleData(NamedTuple):
+    doc_number: str
+    issue_date: str
+    reg_number: str
+    make: str
+    model: str
+    year: str
+    engine_number: str
+    chassis_number: str
+    color: str
+    fuel_type: str
+    owner_name: str
+    owner_address: str
+    owner_id: str
+    owner_phone: str
+
+class DriverData(NamedTuple):
+    license_number: str
+    license_class: str
+    expiry_date: str
+    full_name: str
+    date_of_birth: str
+    address: str
+    restrictions: tuple = ('NONE',)
+
+class InspectionData(NamedTuple):
+    inspection_date: str
+    inspector_name: str
+    inspector_license: str
+    station_name: str
+    certificate_number: str
+    reg_number: str
+    make: str
+    model: str
+    year: str
+    mileage: str
+    vin: str
+    result: str
+
+class PolicyData(NamedTuple):
+    policy_number: str
+    start_date: str
+    end_date: str
+    company_name: str
+    agent_name: str
+    issue_date: str
+    insured_name: str
+    insured_address: str
+    insured_phone: str
+    insured_email: str
+    license_number: str
+    vehicle_year: str
+    vehicle_make: str
+    vehicle_model: str
+    vehicle_vin: str
+    license_plate: str
+    vehicle_use: str
+
+class ClaimData(NamedTuple):
+    claim_number: str
+    report_date: str
+    policy_number: str
+    insured_name: str
+    phone: str
+    email: str
+    loss_date: str
+    loss_time: str
+    location: str
+    description: str
+    vehicle: str
+    license_plate: str
+    vin: str
+    estimated_damage: str
+    signature: str
+    signature_date: str
+
+# Underscore rules printed on the blank claim form in place of each value
+_BLANK_CLAIM = ClaimData(*["_" * 48] * len(ClaimData._fields))._replace(
+    claim_number="_" * 24,
+    report_date="_" * 24
+)
+
+def _vehicle_data_1():
+    """Sample data for the first vehicle registration"""
+    return VehicleData(
+        doc_number='REG-2024-001234',
+        issue_date='2024-03-15',
+        reg_number='ABC-123-DE',
+        make='Toyota',
+        model='Camry',
+        year='2022',
+        engine_number='ENG789456123',
+        chassis_number='CHS456789012',
+        color='Silver',
+        fuel_type='Gasoline',
+        owner_name='John Michael Smith',
+        owner_address='123 Main Street, Springfield, IL 62701',
+        owner_id='ID123456789',
+        owner_phone='(555) 123-4567'
+    )
+
+def _vehicle_data_2():
+    """Sample data for the second vehicle registration"""
+    return VehicleData(
+        doc_number='REG-2024-005678',
+        issue_date='2024-01-22',
+        reg_number='XYZ-789-FG',
+        make='Honda',
+        model='Civic',
+        year='2023',
+        engine_number='ENG321654987',
+        chassis_number='CHS987654321',
+        color='Blue',
+        fuel_type='Gasoline',
+        owner_name='Sarah Elizabeth Johnson',
+        owner_address='456 Oak Avenue, Chicago, IL 60601',
+        owner_id='ID987654321',
+        owner_phone='(555) 987-6543'
+    )
+
+def _driver_data_1():
+    """Sample data for the first driver's license"""
+    return DriverData(
+        license_number='DL123456789',
+        license_class='Class C',
+        expiry_date='2027-05-15',
+        full_name='John Michael Smith',
+        date_of_birth='1985-08-22',
+        address='123 Main Street, Springfield, IL',
+        restrictions=('CORRECTIVE LENSES',)
+    )
+
+def _driver_data_2():
+    """Sample data for the second driver's license"""
+    return DriverData(
+        license_number='DL987654321',
+        license_class='Class C',
+        expiry_date='2026-11-30',
+        full_name='Sarah Elizabeth Johnson',
+        date_of_birth='1990-03-10',
+        address='456 Oak Avenue, Chicago, IL',
+        restrictions=('NONE',)
+    )
+
+def _inspection_data():
+    """Sample data for the vehicle inspection report"""
+    return InspectionData(
+        inspection_date='2024-08-15',
+        inspector_name='Robert Wilson',
+        inspector_license='INS-54321',
+        station_name='Central Auto Inspection Station',
+        certificate_number='CERT-2024-789',
+        reg_number='ABC-123-DE',
+        make='Toyota',
+        model='Camry',
+        year='2022',
+        mileage='25,485',
+        vin='1HGCM82633A123456',
+        result='PASS'
+    )
+
+def _policy_data():
+    """Sample data for the insurance policy"""
+    return PolicyData(
+        policy_number='POL-2024-567890',
+        start_date='2024-01-01',
+        end_date='2024-12-31',
+        company_name='Sample Insurance Company',
+        agent_name='Michael Thompson',
+        issue_date='2023-12-15',
+        insured_name='John Michael Smith',
+        insured_address='123 Main Street, Springfield, IL 62701',
+        insured_phone='(555) 123-4567',
+        insured_email='john.smith@email.com',
+        license_number='DL123456789',
+        vehicle_year='2022',
+        vehicle_make='Toyota',
+        vehicle_model='Camry',
+        vehicle_vin='1HGCM82633A123456',
+        license_plate='ABC-123-DE',
+        vehicle_use='Personal'
+    )
+
+def _claim_data():
+    """Sample data for the completed claim form"""
+    return ClaimData(
+        claim_number='CLM-2024-001234',
+        report_date='2024-09-10',
+        policy_number='POL-2024-567890',
+        insured_name='John Michael Smith',
+        phone='(555) 123-4567',
+        email='john.smith@email.com',
+        loss_date='2024-09-08',
+        loss_time='2:30 PM',
+        location='Intersection of Main St and Oak Ave, Springfield, IL',
+        description='Rear-end collision at traffic light. Other driver failed to stop.',
+        vehicle='2022 Toyota Camry',
+        license_plate='ABC-123-DE',
+        vin='1HGCM82633A123456',
+        estimated_damage='3,500',
+        signature='John M. Smith',
+        signature_date='2024-09-10'
+    )
+
+def _no_data():
+    """The blank claim form is drawn without sample data"""
+    return None
+
+# Registrations and licences are built twice, once per sample vehicle and driver
+_GENERATORS = {
+    'vehicle_registration_1': ('vehicle_registration_1.pdf', create_vehicle_registration, _vehicle_data_1),
+    'vehicle_registration_2': ('vehicle_registration_2.pdf', create_vehicle_registration, _vehicle_data_2),
+    'drivers_license_1': ('drivers_license_1.pdf', create_drivers_license, _driver_data_1),
+    'drivers_license_2': ('drivers_license_2.pdf', create_drivers_license, _driver_data_2),
+    'vehicle_inspection_report': ('vehicle_inspection_report.pdf', create_vehicle_inspection_report, _inspection_data),
+    'insurance_policy': ('insurance_policy.pdf', create_insurance_policy, _policy_data),
+    'claim_form_completed': ('claim_form_completed.pdf', create_claim_form, _claim_data),
+    'claim_form_blank': ('claim_form_blank.pdf', functools.partial(create_claim_form, is_blank=True), _no_data)
+}
 
-def generate_motor_insurance_docs():
-    """Generate all motor insurance documents"""
-    # Sample data
-    vehicle_data_1 = {
-        'doc_number': 'REG-2024-001234',
-        'issue_date': '2024-03-15',
-        'reg_number': 'ABC-123-DE',
-        'make': 'Toyota',
-        'model': 'Camry',
-        'year': '2022',
-        'engine_number': 'ENG789456123',
-        'chassis_number': 'CHS456789012',
-        'color': 'Silver',
-        'fuel_type': 'Gasoline',
-        'owner_name': 'John Michael Smith',
-        'owner_address': '123 Main Street, Springfield, IL 62701',
-        'owner_id': 'ID123456789',
-        'owner_phone': '(555) 123-4567'
-    }
-    
-    vehicle_data_2 = {
-        'doc_number': 'REG-2024-005678',
-        'issue_date': '2024-01-22',
-        'reg_number': 'XYZ-789-FG',
-        'make': 'Honda',
-        'model': 'Civic',
-        'year': '2023',
-        'engine_number': 'ENG321654987',
-        'chassis_number': 'CHS987654321',
-        'color': 'Blue',
-        'fuel_type': 'Gasoline',
-        'owner_name': 'Sarah Elizabeth Johnson',
-        'owner_address': '456 Oak Avenue, Chicago, IL 60601',
-        'owner_id': 'ID987654321',
-        'owner_phone': '(555) 987-6543'
-    }
-    
-    driver_data_1 = {
-        'license_number': 'DL123456789',
-        'license_class': 'Class C',
-        'expiry_date': '2027-05-15',
-        'full_name': 'John Michael Smith',
-        'date_of_birth': '1985-08-22',
-        'address': '123 Main Street, Springfield, IL',
-        'restrictions': ['CORRECTIVE LENSES']
-    }
-    
-    driver_data_2 = {
-        'license_number': 'DL987654321',
-        'license_class': 'Class C',
-        'expiry_date': '2026-11-30',
-        'full_name': 'Sarah Elizabeth Johnson',
-        'date_of_birth': '1990-03-10',
-        'address': '456 Oak Avenue, Chicago, IL',
-        'restrictions': ['NONE']
-    }
-    
-    inspection_data = {
-        'inspection_date': '2024-08-15',
-        'inspector_name': 'Robert Wilson',
-        'inspector_license': 'INS-54321',
-        'station_name': 'Central Auto Inspection Station',
-        'certificate_number': 'CERT-2024-789',
-        'reg_number': 'ABC-123-DE',
-        'make': 'Toyota',
-        'model': 'Camry',
-        'year': '2022',
-        'mileage': '25,485',
-        'vin': '1HGCM82633A123456',
-        'result': 'PASS'
-    }
-    
-    policy_data = {
-        'policy_number': 'POL-2024-567890',
-        'start_date': '2024-01-01',
-        'end_date': '2024-12-31',
-        'company_name': 'Sample Insurance Company',
-        'agent_name': 'Michael Thompson',
-        'issue_date': '2023-12-15',
-        'insured_name': 'John Michael Smith',
-        'insured_address': '123 Main Street, Springfield, IL 62701',
-        'insured_phone': '(555) 123-4567',
-        'insured_email': 'john.smith@email.com',
-        'license_number': 'DL123456789',
-        'vehicle_year': '2022',
-        'vehicle_make': 'Toyota',
-        'vehicle_model': 'Camry',
-        'vehicle_vin': '1HGCM82633A123456',
-        'license_plate': 'ABC-123-DE',
-        'vehicle_use': 'Personal'
-    }
-    
-    claim_data = {
-        'claim_number': 'CLM-2024-001234',
-        'report_date': '2024-09-10',
-        'policy_number': 'POL-2024-567890',
-        'insured_name': 'John Michael Smith',
-        'phone': '(555) 123-4567',
-        'email': 'john.smith@email.com',
-        'loss_date': '2024-09-08',
-        'loss_time': '2:30 PM',
-        'location': 'Intersection of Main St and Oak Ave, Springfield, IL',
-        'description': 'Rear-end collision at traffic light. Other driver failed to stop.',
-        'vehicle': '2022 Toyota Camry',
-        'license_plate': 'ABC-123-DE',
-        'vin': '1HGCM82633A123456',
-        'estimated_damage': '3,500',
-        'signature': 'John M. Smith',
-        'signature_date': '2024-09-10'
-    }
-    
-    # Generate documents
-    create_vehicle_registration('test-documents/motor-insurance/vehicle_registration_1.pdf', vehicle_data_1)
-    create_vehicle_registration('test-documents/motor-insurance/vehicle_registration_2.pdf', vehicle_data_2)
-    create_drivers_license('test-documents/motor-insurance/drivers_license_1.pdf', driver_data_1)
-    create_drivers_license('test-documents/motor-insurance/drivers_license_2.pdf', driver_data_2)
-    create_vehicle_inspection_report('test-documents/motor-insurance/vehicle_inspection_report.pdf', inspection_data)
-    create_insurance_policy('test-documents/motor-insurance/insurance_policy.pdf', policy_data)
-    create_claim_form('test-documents/motor-insurance/claim_form_completed.pdf', claim_data, False)
-    create_claim_form('test-documents/motor-insurance/claim_form_blank.pdf', {}, True)
+def generate_motor_insurance_docs(*which):
+    """Generate all motor insurance documents, or only the ones named"""
+    render_documents('test-documents/motor-insurance', _GENERATORS, which, max_workers=8)
 
 if __name__ == "__main__":
     generate_motor_insurance_docs()
@@ -0,0 +1,108 @@
+"""
+Drawing helpers shared by the sample PDF generators
+All content is fictional and for testing purposes only
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Table, TableStyle
+
+# Line leading and top padding of label/value tables. The style sets both
+# explicitly so that label_value_table can size its rows from them
+_LABEL_VALUE_LEADING = 12
+_LABEL_VALUE_TOP_PADDING = 3
+
+def preload_fonts(*font_names):
+    """Load font metrics once per process (every pool worker imports its generator) instead of inside a build"""
+    for font_name in font_names:
+        pdfmetrics.getFont(font_name)
+
+def draw_detail_rows(c, y_pos, rows, leading=25, label_x=50, value_x=200, font=("Helvetica", 11)):
+    """Draw label/value rows as two text objects and return the y position below them"""
+    labels = c.beginText(label_x, y_pos)
+    labels.setFont(*font, leading)
+    values = c.beginText(value_x, y_pos)
+    values.setFont(*font, leading)
+    for label, value in rows:
+        labels.textLine(label)
+        values.textLine(value)
+    c.drawText(labels)
+    c.drawText(values)
+    return y_pos - leading * len(rows)
+
+@functools.lru_cache(maxsize=None)
+def label_value_table_style(fontsize=10, padding=6):
+    """Bold-label two-column table style, one shared instance per size"""
+    return TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), fontsize),
+        ('LEADING', (0, 0), (-1, -1), _LABEL_VALUE_LEADING),
+        ('TOPPADDING', (0, 0), (-1, -1), _LABEL_VALUE_TOP_PADDING),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+    ])
+
+def label_value_table(rows, fontsize=10, padding=6, col_widths=(2*inch, 4*inch)):
+    """Build a label/value table of plain-string cells with precomputed row heights
+
+    Each row is as tall as its cell with the most lines, so values may contain
+    newlines. Cells must not be flowables, which Table would measure instead.
+    """
+    row_heights = [
+        _LABEL_VALUE_LEADING * max(str(cell).count("\n") + 1 for cell in row) + _LABEL_VALUE_TOP_PADDING + padding
+        for row in rows
+    ]
+    table = Table(rows, colWidths=col_widths, rowHeights=row_heights)
+    table.setStyle(label_value_table_style(fontsize, padding))
+    return table
+
+# Grey header row of the generators' grid tables; each grid style derives
+# from it and adds its own alignment, font size and rules
+GREY_HEADER_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+@functools.lru_cache(maxsize=None)
+def grid_table_style(align='LEFT'):
+    """Grey-header 9pt grid table style, one shared instance per alignment"""
+    return TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ], parent=GREY_HEADER_STYLE)
+
+# Centred grey-header grid whose last row is a bold total, ruled off above
+# its last two columns instead of gridded
+TOTAL_ROW_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -2), 1, colors.black),
+    ('LINEABOVE', (2, -1), (-1, -1), 2, colors.black)
+], parent=GREY_HEADER_STYLE)
+
+def render_documents(directory, generators, names, max_workers):
+    """Build the named documents, or every document when names is empty, in a process pool
+
+    generators maps each document name to (output file, builder, data factory).
+    Sample data is only built for the selected documents.
+    """
+    unknown = [name for name in names if not isinstance(name, str) or name not in generators]
+    if unknown:
+        raise ValueError(f"Unknown document name(s) {unknown}; expected any of {sorted(generators)}")
+    os.makedirs(directory, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(builder, os.path.join(directory, filename), make_data())
+            for filename, builder, make_data in (generators[name] for name in names or generators)
+        ]
+        for future in futures:
+            future.result()